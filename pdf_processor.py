@@ -2,10 +2,13 @@ import pypdf
 from pathlib import Path
 import tempfile
 import math
+import io
 from typing import List, Dict, Any, Optional
 import os
 import shutil
 import subprocess # subprocess modülünü tepeye ekledim
+import atexit
+import threading
 
 # --- AYARLAR VE PATH BULMA ---
 
@@ -32,6 +35,73 @@ if POPPLER_PATH is None:
 # pdftoppm komutunun tam yolunu belirle (Bu değişkeni aşağıda kullanacağız)
 PDFTOPPM_BIN = os.path.join(POPPLER_PATH, 'pdftoppm') if POPPLER_PATH else 'pdftoppm'
 
+# OCR rasterizasyon ayarları: Basılı Türkçe metin için 150 DPI yeterli,
+# JPEG çıktısı PNG/PPM'e göre hem daha hızlı üretilir hem de bellekte daha küçük kalır
+OCR_DPI = int(os.getenv("OCR_DPI", "150"))
+OCR_IMAGE_FORMAT = os.getenv("OCR_IMAGE_FORMAT", "jpeg")
+
+# Bu sayfa sayısının altında paralel çıkarım süreç başlatma maliyetine değmez
+PARALLEL_EXTRACT_MIN_PAGES = int(os.getenv("PARALLEL_EXTRACT_MIN_PAGES", "40"))
+# Paylaşılan çıkarım havuzunun süreç sayısı: eşzamanlı istekler aynı havuzu kullanır (CPU aşırı yüklenmez)
+PARALLEL_EXTRACT_MAX_WORKERS = int(os.getenv("PARALLEL_EXTRACT_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Süreç havuzu ilk büyük PDF'te bir kez oluşturulur; alt süreçler (interpreter + pdfplumber importu)
+# sonraki belgelerde yeniden kullanılır, çıkışta kapatılır
+_EXTRACT_POOL = None
+_EXTRACT_POOL_LOCK = threading.Lock()
+
+
+def _get_extract_pool():
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            from concurrent.futures import ProcessPoolExecutor
+            import multiprocessing
+            # spawn: çok thread'li sunucu sürecinden fork etmekten kaçın
+            _EXTRACT_POOL = ProcessPoolExecutor(
+                max_workers=PARALLEL_EXTRACT_MAX_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _EXTRACT_POOL
+
+
+def _shutdown_extract_pool(expected=None) -> None:
+    """Paylaşılan çıkarım havuzunu kapatır (oluşturulduysa).
+
+    expected verilirse sadece havuz hâlâ o örnekse kapatılır (başka thread yenisini kurduysa dokunulmaz).
+    """
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if expected is not None and _EXTRACT_POOL is not expected:
+            return
+        pool, _EXTRACT_POOL = _EXTRACT_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_extract_pool)
+
+
+def extract_page_range_texts(pdf_path, start_index: int, end_index: int) -> List[Optional[str]]:
+    """[start_index, end_index) aralığındaki sayfaların metnini pdfplumber ile çıkarır.
+
+    Modül seviyesinde tanımlı olduğu için ProcessPoolExecutor alt süreçlerinde çalışabilir;
+    her süreç PDF'i kendisi açar. pdf_path dosya yolu, PDF baytları veya dosya benzeri nesne olabilir.
+    Okunamayan sayfalar için None döner.
+    """
+    import pdfplumber
+    if isinstance(pdf_path, (bytes, bytearray)):
+        pdf_path = io.BytesIO(pdf_path)
+    texts = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_index in range(start_index, min(end_index, len(pdf.pages))):
+            try:
+                texts.append(pdf.pages[page_index].extract_text())
+            except Exception:
+                texts.append(None)
+    return texts
+
+
 class PDFProcessor:
     """PDF işleme ve bölümlendirme sınıfı"""
     
@@ -39,6 +109,19 @@ class PDFProcessor:
         self._ocr_available = None  # Lazy check for OCR availability
         self._ocr_cache: Dict[tuple, str] = {}  # OCR cache: (pdf_path, page_num) -> text
         self._rapidocr_instance = None  # RapidOCR instance (lazy initialization)
+        self._pdf_bytes: Dict[str, bytes] = {}  # Bellekteki PDF içerikleri: pdf_path -> bytes
+    
+    def register_pdf_bytes(self, pdf_path: str, pdf_bytes: Optional[bytes]) -> None:
+        """PDF içeriğini bellekte tutar; bu yol için sonraki okumalar diske gitmez"""
+        if pdf_bytes:
+            self._pdf_bytes[pdf_path] = pdf_bytes
+    
+    def _open_pdf(self, pdf_path: str):
+        """PDF'i bellekten (kayıtlıysa) veya diskten okumak için dosya nesnesi döner"""
+        pdf_bytes = self._pdf_bytes.get(pdf_path)
+        if pdf_bytes is not None:
+            return io.BytesIO(pdf_bytes)
+        return open(pdf_path, 'rb')
     
     def _check_ocr_available(self) -> bool:
         """OCR kütüphanesinin kullanılabilir olup olmadığını kontrol eder"""
@@ -94,28 +177,30 @@ class PDFProcessor:
             return self._ocr_cache[cache_key]
         
         try:
-            from pdf2image import convert_from_path
+            from pdf2image import convert_from_path, convert_from_bytes
             
-            # Poppler ön kontrolü (DÜZELTİLDİ: Tam yol kullanılıyor)
-            try:
-                subprocess.run([PDFTOPPM_BIN, '-v'], capture_output=True, timeout=5)
-            except Exception as e:
-                 # Önemsiz hataları yutabiliriz, asıl işi convert_from_path yapacak
-                 pass
+            # Poppler kontrolü _check_ocr_available içinde bir kez yapılıyor,
+            # sayfa başına ayrıca pdftoppm süreci başlatılmıyor
             
-            # PDF sayfasını görüntüye çevir
+            # PDF sayfasını görüntüye çevir (düşük DPI + JPEG, dosyaya yazmadan bellekte)
             try:
                 convert_kwargs = {
                     'first_page': page_num + 1,
                     'last_page': page_num + 1,
-                    'dpi': 300,
+                    'dpi': OCR_DPI,
+                    'fmt': OCR_IMAGE_FORMAT,
+                    'use_pdftocairo': True,
                     'thread_count': 1
                 }
                 # Poppler yolu bulunduysa ekle
                 if POPPLER_PATH:
                     convert_kwargs['poppler_path'] = POPPLER_PATH
                 
-                images = convert_from_path(pdf_path, **convert_kwargs)
+                pdf_bytes = self._pdf_bytes.get(pdf_path)
+                if pdf_bytes is not None:
+                    images = convert_from_bytes(pdf_bytes, **convert_kwargs)
+                else:
+                    images = convert_from_path(pdf_path, **convert_kwargs)
             except Exception as pdf_error:
                 error_msg = str(pdf_error).lower()
                 if "poppler" in error_msg or "pdftoppm" in error_msg:
@@ -161,7 +246,7 @@ class PDFProcessor:
 
     def analyze_pdf_structure(self, pdf_path: str, skip_text_analysis: bool = False) -> Dict[str, Any]:
         try:
-            with open(pdf_path, 'rb') as file:
+            with self._open_pdf(pdf_path) as file:
                 reader = pypdf.PdfReader(file)
                 total_pages = len(reader.pages)
                 
@@ -241,7 +326,7 @@ class PDFProcessor:
     def create_section_pdf(self, source_pdf_path: str, start_page: int, 
                           end_page: int, output_dir: str, section_num: int) -> str:
         try:
-            with open(source_pdf_path, 'rb') as source_file:
+            with self._open_pdf(source_pdf_path) as source_file:
                 reader = pypdf.PdfReader(source_file)
                 writer = pypdf.PdfWriter()
                 for page_num in range(start_page - 1, end_page):
@@ -258,7 +343,7 @@ class PDFProcessor:
     def extract_text_from_pages(self, pdf_path: str, start_page: int, end_page: int, use_ocr: bool = False) -> str:
         text = ""
         try:
-            with open(pdf_path, 'rb') as file:
+            with self._open_pdf(pdf_path) as file:
                 reader = pypdf.PdfReader(file)
                 total_pages = len(reader.pages)
                 actual_end_page = min(end_page, total_pages)
@@ -285,10 +370,47 @@ class PDFProcessor:
         except Exception as e:
             raise Exception(f"Metin çıkarma hatası: {str(e)}")
             
+    def extract_page_texts_parallel(self, pdf_path: str, total_pages: int = 0, max_workers: Optional[int] = None) -> List[Optional[str]]:
+        """Tüm sayfaların metnini sayfa sırasını koruyarak çıkarır (OCR yok).
+
+        Büyük PDF'lerde sayfalar paylaşılan süreç havuzuna bölünür; küçük PDF'ler
+        havuza gönderme maliyetinden kaçınmak için aynı süreçte işlenir.
+        """
+        if total_pages <= 0:
+            with self._open_pdf(pdf_path) as file:
+                total_pages = len(pypdf.PdfReader(file).pages)
+        
+        workers = min(max_workers or PARALLEL_EXTRACT_MAX_WORKERS, PARALLEL_EXTRACT_MAX_WORKERS, total_pages)
+        if total_pages < PARALLEL_EXTRACT_MIN_PAGES or workers <= 1:
+            with self._open_pdf(pdf_path) as file:
+                return extract_page_range_texts(file, 0, total_pages)
+        
+        from concurrent.futures.process import BrokenProcessPool
+        
+        # Her göreve ardışık bir sayfa bloğu ver (PDF her görevde bir kez açılır);
+        # bellekte kayıtlı PDF varsa alt süreçler diski değil bu baytları kullanır
+        source = self._pdf_bytes.get(pdf_path, pdf_path)
+        chunk_size = math.ceil(total_pages / workers)
+        ranges = [(start, min(start + chunk_size, total_pages)) for start in range(0, total_pages, chunk_size)]
+        pool = _get_extract_pool()
+        try:
+            results = pool.map(
+                extract_page_range_texts,
+                [source] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges]
+            )
+            return [text for chunk in results for text in chunk]
+        except BrokenProcessPool:
+            # Bir alt süreç çöktüyse havuz kullanılamaz: sonraki çağrı için sıfırla, bu belgeyi sıralı işle
+            _shutdown_extract_pool(pool)
+            with self._open_pdf(pdf_path) as file:
+                return extract_page_range_texts(file, 0, total_pages)
+    
     def extract_all_page_texts(self, pdf_path: str, use_ocr: bool = False) -> List[str]:
         page_texts = []
         try:
-            with open(pdf_path, 'rb') as file:
+            with self._open_pdf(pdf_path) as file:
                 reader = pypdf.PdfReader(file)
                 num_pages = len(reader.pages)
             
@@ -321,7 +443,7 @@ class PDFProcessor:
     
     def get_pdf_metadata(self, pdf_path: str) -> Dict[str, Any]:
         try:
-            with open(pdf_path, 'rb') as file:
+            with self._open_pdf(pdf_path) as file:
                 reader = pypdf.PdfReader(file)
                 metadata = reader.metadata if reader.metadata else {}
                 return {
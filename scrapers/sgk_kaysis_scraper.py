@@ -9,6 +9,8 @@ import re
 import json
 import unicodedata
 
+from sgk_scraper import _uploaded_doc_titles
+
 # Streamlit import (opsiyonel - use_streamlit parametresi ile kontrol edilir)
 try:
     import streamlit as st
@@ -212,18 +214,9 @@ def get_uploaded_documents(api_base_url: str, access_token: str, use_streamlit:
 
 def check_if_document_exists(document_title: str, uploaded_documents: List[Dict[str, Any]]) -> bool:
     """Belge başlığının API'de yüklü olup olmadığını kontrol eder"""
-    for doc in uploaded_documents:
-        # title, document_title, belge_adi alanlarını kontrol et
-        doc_titles = [
-            doc.get('title', ''),
-            doc.get('document_title', ''),
-            doc.get('belge_adi', ''),
-            doc.get('filename', '')
-        ]
-        
-        for doc_title in doc_titles:
-            if doc_title and is_title_similar(document_title, doc_title):
-                return True
+    for doc_title in _uploaded_doc_titles(uploaded_documents):
+        if is_title_similar(document_title, doc_title):
+            return True
     
     return False
 
@@ -298,7 +291,8 @@ def scrape_sgk_mevzuat(url: str = "https://kms.kaysis.gov.tr/Home/Kurum/22620739
             return [], {}
         
         # HTML'i parse et
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # KAYSİS sayfaları UTF-8; from_encoding ile kodlama tahmini (chardet) atlanır
+        soup = BeautifulSoup(response.content, 'html.parser', from_encoding='utf-8')
         print("✅ Site başarıyla yüklendi!")
         
         print("📋 Accordion yapısı aranıyor...")
@@ -352,6 +346,11 @@ def scrape_sgk_mevzuat(url: str = "https://kms.kaysis.gov.tr/Home/Kurum/22620739
                 for link in links_in_panel:
                     link_href = link.get('href', '')
                     
+                    # Sadece /Home/Goster/ linklerini al; ham href üzerinde, metin/URL işlemlerinden önce
+                    # (sayfa kökü /Home/Kurum/... olduğundan tamamlanan URL'de de aynı sonucu verir)
+                    if '/Home/Goster/' not in link_href:
+                        continue
+                    
                     # Link içinde badge span'i varsa atla
                     if link.find('span', class_='badge'):
                         continue
@@ -375,10 +374,6 @@ def scrape_sgk_mevzuat(url: str = "https://kms.kaysis.gov.tr/Home/Kurum/22620739
                     else:
                         full_url = f"{url}{link_href}"
                     
-                    # Sadece /Home/Goster/ ile başlayan linkleri al
-                    if not full_url or '/Home/Goster/' not in full_url:
-                        continue
-                    
                     # Metni formatla: yalnızca başlığın ilk harfi büyük, diğerleri küçük (Türkçe)
                     formatted_text = turkish_sentence_case(link_text)
                     formatted_text = re.sub(r'\d+$', '', formatted_text).strip()
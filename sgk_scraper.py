@@ -1,4 +1,3 @@
-import streamlit as st
 import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Any, Optional
@@ -6,6 +5,13 @@ import re
 import json
 import unicodedata
 
+# Streamlit import (opsiyonel - bu modülün yardımcıları scrapers/ ve API tarafından da kullanılır)
+try:
+    import streamlit as st
+    STREAMLIT_AVAILABLE = True
+except ImportError:
+    STREAMLIT_AVAILABLE = False
+
 
 def normalize_text(text: str) -> str:
     """Metni karşılaştırma için normalize eder (büyük/küçük harf, boşluklar)"""
@@ -125,7 +131,7 @@ def get_uploaded_documents(api_base_url: str, access_token: str, use_streamlit:
                     
                     # Güvenlik için maksimum 50 sayfa (5000 belge) çek
                     if page > 50:
-                        if use_streamlit:
+                        if use_streamlit and STREAMLIT_AVAILABLE:
                             st.warning("⚠️ Çok fazla belge var. İlk 5000 belge çekildi.")
                         else:
                             print("⚠️ Çok fazla belge var. İlk 5000 belge çekildi.")
@@ -133,7 +139,7 @@ def get_uploaded_documents(api_base_url: str, access_token: str, use_streamlit:
                 else:
                     has_more = False
             elif response.status_code == 401:
-                if use_streamlit:
+                if use_streamlit and STREAMLIT_AVAILABLE:
                     st.warning("⚠️ Oturum süresi dolmuş. Lütfen tekrar giriş yapın.")
                 else:
                     print("⚠️ Oturum süresi dolmuş. Lütfen tekrar giriş yapın.")
@@ -142,14 +148,14 @@ def get_uploaded_documents(api_base_url: str, access_token: str, use_streamlit:
                 try:
                     error_data = response.json()
                     error_msg = error_data.get('error', {}).get('message', 'Bilinmeyen hata')
-                    if use_streamlit:
+                    if use_streamlit and STREAMLIT_AVAILABLE:
                         st.warning(f"⚠️ API parametre hatası: {error_msg}")
                         st.code(error_data, language="json")
                     else:
                         print(f"⚠️ API parametre hatası: {error_msg}")
                         print(f"Error details: {error_data}")
                 except:
-                    if use_streamlit:
+                    if use_streamlit and STREAMLIT_AVAILABLE:
                         st.warning(f"⚠️ API'den belgeler çekilemedi: HTTP 422 (Unprocessable Entity)")
                         st.code(response.text[:500] if response.text else "Hata mesajı alınamadı", language="text")
                     else:
@@ -157,7 +163,7 @@ def get_uploaded_documents(api_base_url: str, access_token: str, use_streamlit:
                         print(response.text[:500] if response.text else "Hata mesajı alınamadı")
                 return []
             else:
-                if use_streamlit:
+                if use_streamlit and STREAMLIT_AVAILABLE:
                     st.warning(f"⚠️ API'den belgeler çekilemedi: HTTP {response.status_code}")
                     if response.text:
                         try:
@@ -180,26 +186,40 @@ def get_uploaded_documents(api_base_url: str, access_token: str, use_streamlit:
         return completed_documents
             
     except Exception as e:
-        if use_streamlit:
+        if use_streamlit and STREAMLIT_AVAILABLE:
             st.warning(f"⚠️ API bağlantı hatası: {str(e)}")
         else:
             print(f"⚠️ API bağlantı hatası: {str(e)}")
         return []
 
+# Belge başlığının aranacağı alanlar (title, document_title, belge_adi, filename)
+_DOC_TITLE_FIELDS = ('title', 'document_title', 'belge_adi', 'filename')
+# Son görülen belge listesi ve boş olmayan başlıkları: tarama döngüsü aynı listeyi her öğe için
+# gönderdiğinden başlıklar liste başına bir kez çıkarılır (öğe x belge kadar liste kurulmaz)
+_doc_titles_cache = (None, ())
+
+
+def _uploaded_doc_titles(uploaded_documents: List[Dict[str, Any]]) -> tuple:
+    """Yüklü belgelerin boş olmayan başlıklarını döner (aynı liste için önbellekten)"""
+    global _doc_titles_cache
+    cached_docs, cached_titles = _doc_titles_cache
+    if cached_docs is uploaded_documents:
+        return cached_titles
+    titles = tuple(
+        doc_title
+        for doc in uploaded_documents
+        for doc_title in (doc.get(field, '') for field in _DOC_TITLE_FIELDS)
+        if doc_title
+    )
+    _doc_titles_cache = (uploaded_documents, titles)
+    return titles
+
+
 def check_if_document_exists(document_title: str, uploaded_documents: List[Dict[str, Any]]) -> bool:
     """Belge başlığının API'de yüklü olup olmadığını kontrol eder"""
-    for doc in uploaded_documents:
-        # title, document_title, belge_adi alanlarını kontrol et
-        doc_titles = [
-            doc.get('title', ''),
-            doc.get('document_title', ''),
-            doc.get('belge_adi', ''),
-            doc.get('filename', '')
-        ]
-        
-        for doc_title in doc_titles:
-            if doc_title and is_title_similar(document_title, doc_title):
-                return True
+    for doc_title in _uploaded_doc_titles(uploaded_documents):
+        if is_title_similar(document_title, doc_title):
+            return True
     
     return False
 